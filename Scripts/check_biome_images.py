@@ -3,11 +3,22 @@
 
 import argparse
 import json
+import os
 from collections import defaultdict
 from pathlib import Path
 import difflib
 import sys
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # optional accelerator; fall back to difflib
+    process = None
+
+try:
+    import orjson
+except ImportError:  # optional fast parser; fall back to json
+    orjson = None
+
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -37,41 +48,60 @@ def normalize_image_name(image_path):
         return ""
     if image_path.startswith("res://"):
         image_path = image_path[6:]
-    return Path(image_path).name
+    return os.path.basename(image_path.rstrip("/"))
 
 
 def collect_assets(asset_dir):
     assets = []
-    for entry in Path(asset_dir).iterdir():
-        if not entry.is_file():
-            continue
-        if entry.suffix.lower() != ".png":
-            continue
-        if ":" in entry.name or entry.name.endswith(".import"):
-            continue
-        assets.append(entry)
+    with os.scandir(asset_dir) as entries:
+        for entry in entries:
+            if not entry.name.lower().endswith(".png"):
+                continue
+            if ":" in entry.name:
+                continue
+            if not entry.is_file():
+                continue
+            assets.append(Path(entry.path))
     return sorted(assets)
 
 
 def load_biomes(biome_json):
-    with open(biome_json, encoding="utf-8") as handle:
-        data = json.load(handle)
+    # The biome list is small enough to parse in one go; orjson just does it faster.
+    if orjson is not None:
+        data = orjson.loads(Path(biome_json).read_bytes())
+    else:
+        with open(biome_json, encoding="utf-8") as handle:
+            data = json.load(handle)
     if not isinstance(data, list):
         raise ValueError("Biome JSON should be a list of entries.")
     return data
 
 
+def suggest_matches(image_name, asset_names, min_score):
+    if process is None:
+        return difflib.get_close_matches(image_name, asset_names, n=3, cutoff=min_score)
+    return [
+        match for match, _score, _index in process.extract(
+            image_name, asset_names, scorer=fuzz.ratio, limit=3, score_cutoff=min_score * 100
+        )
+    ]
+
+
 def build_asset_index(assets):
-    by_name = {asset.name: asset for asset in assets}
+    names = set()
     by_lower = defaultdict(list)
     for asset in assets:
-        by_lower[asset.name.lower()].append(asset)
-    return by_name, by_lower
+        asset_name = asset.name
+        names.add(asset_name)
+        by_lower[asset_name.lower()].append(asset_name)
+    return frozenset(names), by_lower
 
 
 def report(biomes, assets, args):
-    by_name, by_lower = build_asset_index(assets)
-    asset_names = sorted(by_name)
+    asset_name_set, by_lower = build_asset_index(assets)
+    asset_names = [asset.name for asset in assets]  # collect_assets() already sorted
+    # Distinct lowercased names; by_lower maps each back to every real spelling
+    asset_norm = list(by_lower)
     referenced_files = defaultdict(list)
     missing_reports = []
     for entry in biomes:
@@ -81,33 +111,34 @@ def report(biomes, assets, args):
         note_lines = []
         if not image_path:
             note_lines.append("no image_path assigned")
+        elif not image_name:
+            note_lines.append("image_path references empty name")
+        elif image_name in asset_name_set:
+            referenced_files[image_name].append(name)
         else:
-            if image_name in by_name:
-                referenced_files[image_name].append(name)
+            lower_matches = by_lower.get(image_name.lower())
+            if lower_matches:
+                asset_name = lower_matches[0]
+                note_lines.append(
+                    f"case mismatch: builds reference {image_name} but actual file is {asset_name}"
+                )
+                referenced_files[asset_name].append(name)
             else:
-                lower_matches = by_lower.get(image_name.lower())
-                if lower_matches:
-                    asset_name = lower_matches[0].name
+                suggestions = [
+                    asset_name
+                    for match in suggest_matches(image_name.lower(), asset_norm, args.min_match_score)
+                    for asset_name in by_lower[match]
+                ][:3]
+                if suggestions:
                     note_lines.append(
-                        f"case mismatch: builds reference {image_name} but actual file is {asset_name}"
+                        "file not found; best matches: " + ", ".join(suggestions)
                     )
-                    referenced_files[asset_name].append(name)
                 else:
-                    suggestions = [
-                        match for match in difflib.get_close_matches(
-                            image_name, asset_names, n=3, cutoff=args.min_match_score
-                        )
-                    ]
-                    if suggestions:
-                        note_lines.append(
-                            "file not found; best matches: " + ", ".join(suggestions)
-                        )
-                    else:
-                        note_lines.append("file not found and no close match"
-                                          if image_name else "image_path references empty name")
+                    note_lines.append("file not found and no close match")
         if note_lines:
             missing_reports.append((name, image_path, image_name, note_lines))
-    unreferenced = [name for name in asset_names if name not in referenced_files]
+    referenced_set = frozenset(referenced_files)
+    unreferenced = [name for name in asset_names if name not in referenced_set]
 
     if missing_reports:
         print("Biomes with missing or mismatched images:")
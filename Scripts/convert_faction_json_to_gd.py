@@ -5,15 +5,18 @@ Reads spacewheat_factions_db_v0_4.json and generates FactionDatabase.gd
 """
 
 import json
+import re
 import sys
 from pathlib import Path
 
+NON_WORD_RE = re.compile(r"\W")
+
 def sanitize_const_name(name: str) -> str:
     """Convert faction name to valid GDScript constant name"""
     # Replace spaces and special chars with underscores
     const_name = name.upper().replace(" ", "_").replace("'", "").replace("-", "_")
     # Remove any other non-alphanumeric chars
-    const_name = "".join(c if c.isalnum() or c == "_" else "_" for c in const_name)
+    const_name = NON_WORD_RE.sub("_", const_name)
     return const_name
 
 def format_bits_array(bits: list) -> str:
@@ -12,21 +12,30 @@ New fields in v2.1:
 - ring: Position in hierarchy (center, first, second, third, outer)
 """
 
+import io
 import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional fast parser; fall back to json
+    orjson = None
+
+
+# Backslashes, quotes and newlines escaped in a single translate pass
+GDSCRIPT_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '"': '\\"',
+    '\n': '\\n',
+})
+
 
 def escape_gdscript_string(s: str) -> str:
     """Escape a string for GDScript"""
     if s is None:
         return '""'
-    # Escape backslashes first, then quotes
-    s = s.replace('\\', '\\\\')
-    s = s.replace('"', '\\"')
-    # Escape newlines
-    s = s.replace('\n', '\\n')
-    return f'"{s}"'
+    return f'"{s.translate(GDSCRIPT_ESCAPES)}"'
 
 
 def format_emoji_array(emojis: list) -> str:
@@ -44,6 +53,23 @@ def format_bits_array(bits: list) -> str:
     return f"[{', '.join(str(b) for b in bits)}]"
 
 
+def get_axial_emojis(bits: list, axes: list) -> list:
+    """Map a bits array onto axial spine emojis (mirrors _get_axial_emojis)"""
+    result = []
+    for bit, axis in zip(bits, axes):
+        emoji = axis.get("1" if bit == 1 else "0", "")
+        if emoji:
+            result.append(emoji)
+    return result
+
+
+def merge_vocabulary(signature: list, axial_emojis: list) -> list:
+    """Signature followed by axial emojis it doesn't already contain"""
+    seen = set(signature)
+    extra = [emoji for emoji in dict.fromkeys(axial_emojis) if emoji not in seen]
+    return list(signature) + extra
+
+
 DEFAULT_META = {
     "design_philosophy": "Center factions are mundane and grounded - the fairy tale village worth protecting. Moving outward, bureaucracy curdles, mysteries deepen, and cosmic horror waits at the edges. The Carrion Throne is a stable attractor in probability space that doesn't know it's a quantum phenomenon.",
     "player_start": "🌾👥 (wheat/labor) expanding to 💰🍞🚀 (wealth/bread/spaceships)",
@@ -71,12 +97,101 @@ DEFAULT_AXIAL_SPINE = {
 }
 
 
+# Static helper functions appended verbatim after the faction data.
+# The vocabulary helpers are used by QuestTheming/GameStateManager.
+GDSCRIPT_HELPERS = '''\
+
+## Helper Functions
+
+static func get_faction_by_name(name: String) -> Dictionary:
+	"""Get faction by name"""
+	for faction in ALL_FACTIONS:
+		if faction.name == name:
+			return faction
+	return {}
+
+static func get_factions_by_ring(ring: String) -> Array:
+	"""Get all factions in a specific ring"""
+	var result = []
+	for faction in ALL_FACTIONS:
+		if faction.ring == ring:
+			result.append(faction)
+	return result
+
+static func get_factions_by_domain(domain: String) -> Array:
+	"""Get all factions in a specific domain"""
+	var result = []
+	for faction in ALL_FACTIONS:
+		if faction.domain == domain:
+			result.append(faction)
+	return result
+
+static func get_faction_emoji(faction: Dictionary) -> String:
+	"""Get first emoji from faction signature as display emoji"""
+	if faction.has("sig") and faction.sig.size() > 0:
+		return faction.sig[0]
+	return "❓"
+
+static func get_faction_signature_string(faction: Dictionary) -> String:
+	"""Get faction signature as emoji string"""
+	if faction.has("sig"):
+		return "".join(faction.sig)
+	return ""
+
+static func _get_axial_emojis(bits: Array) -> Array:
+	"""Convert 12-bit axial array into emoji list."""
+	var result: Array = []
+	if bits.is_empty():
+		return result
+	for i in range(min(bits.size(), AXIAL_SPINE.axes.size())):
+		var axis = AXIAL_SPINE.axes[i]
+		var bit = bits[i]
+		var emoji = axis.get("1" if bit == 1 else "0", "")
+		if emoji != "":
+			result.append(emoji)
+	return result
+
+static func get_faction_vocabulary(faction: Dictionary) -> Dictionary:
+	"""Return faction vocabulary bundle (signature, axial, all)."""
+	var signature = faction.get("sig", faction.get("signature", []))
+	if faction.has("all_emojis"):
+		return {"signature": signature, "axial": faction.axial_emojis.duplicate(), "all": faction.all_emojis.duplicate()}
+	var axial = _get_axial_emojis(faction.get("bits", []))
+	var all = signature.duplicate()
+	for emoji in axial:
+		if emoji not in all:
+			all.append(emoji)
+	return {"signature": signature, "axial": axial, "all": all}
+
+static func get_vocabulary_overlap(vocab_a: Array, vocab_b: Array) -> Array:
+	"""Return emojis in vocab_a that are also in vocab_b (preserve order)."""
+	var result: Array = []
+	for emoji in vocab_a:
+		if emoji in vocab_b and emoji not in result:
+			result.append(emoji)
+	return result
+
+static func get_faction_banner_path(faction: Dictionary) -> String:
+	"""Return banner asset path if available."""
+	var name = faction.get("name", "")
+	if name == "":
+		return ""
+	var path = "res://Assets/UI/Factions/Banners/%s.svg" % name
+	if ResourceLoader.exists(path):
+		return path
+	return ""
+'''
+
+
 def convert_json_to_gdscript(json_path: Path, output_path: Path):
     """Convert canonical faction JSON to GDScript"""
 
     # Load JSON
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(json_path.read_bytes())
+    else:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
     # Support either legacy lexicon dict or canonical factions list
     if isinstance(data, list):
@@ -93,46 +208,47 @@ def convert_json_to_gdscript(json_path: Path, output_path: Path):
         title = data.get('title', 'SpaceWheat Faction Lexicon')
 
     # Start building GDScript file
-    gd_lines = []
+    buf = io.StringIO()
+    w = buf.write
 
     # Header
-    gd_lines.append("class_name FactionDatabaseV2")
-    gd_lines.append("extends RefCounted")
-    gd_lines.append("")
-    gd_lines.append("## Faction Database v2.1")
-    gd_lines.append("## Generated from Core/Factions/data/factions_merged.json")
-    gd_lines.append(f"## Contains {len(factions)} factions with rich flavor text, mottos, and lore")
-    gd_lines.append("")
+    w("class_name FactionDatabaseV2\n")
+    w("extends RefCounted\n")
+    w("\n")
+    w("## Faction Database v2.1\n")
+    w("## Generated from Core/Factions/data/factions_merged.json\n")
+    w(f"## Contains {len(factions)} factions with rich flavor text, mottos, and lore\n")
+    w("\n")
 
     # Meta information
-    gd_lines.append("## Meta Information")
-    gd_lines.append(f"const VERSION = {escape_gdscript_string(version)}")
-    gd_lines.append(f"const TITLE = {escape_gdscript_string(title)}")
-    gd_lines.append("")
-    gd_lines.append("const META = {")
-    gd_lines.append(f"	\"design_philosophy\": {escape_gdscript_string(meta.get('design_philosophy', ''))},")
-    gd_lines.append(f"	\"player_start\": {escape_gdscript_string(meta.get('player_start', ''))},")
-    gd_lines.append(f"	\"shadow_path\": {escape_gdscript_string(meta.get('shadow_path', ''))},")
-    gd_lines.append(f"	\"quantum_awareness\": {escape_gdscript_string(meta.get('quantum_awareness', ''))},")
-    gd_lines.append(f"	\"patch_notes\": {escape_gdscript_string(meta.get('patch_notes', ''))}")
-    gd_lines.append("}")
-    gd_lines.append("")
+    w("## Meta Information\n")
+    w(f"const VERSION = {escape_gdscript_string(version)}\n")
+    w(f"const TITLE = {escape_gdscript_string(title)}\n")
+    w("\n")
+    w("const META = {\n")
+    w(f"	\"design_philosophy\": {escape_gdscript_string(meta.get('design_philosophy', ''))},\n")
+    w(f"	\"player_start\": {escape_gdscript_string(meta.get('player_start', ''))},\n")
+    w(f"	\"shadow_path\": {escape_gdscript_string(meta.get('shadow_path', ''))},\n")
+    w(f"	\"quantum_awareness\": {escape_gdscript_string(meta.get('quantum_awareness', ''))},\n")
+    w(f"	\"patch_notes\": {escape_gdscript_string(meta.get('patch_notes', ''))}\n")
+    w("}\n")
+    w("\n")
 
     # Axial spine
-    gd_lines.append("## Axial Spine (Bit Encoding)")
-    gd_lines.append("const AXIAL_SPINE = {")
-    gd_lines.append(f"	\"version\": {escape_gdscript_string(axial.get('version', '1.4'))},")
-    gd_lines.append("	\"axes\": [")
+    w("## Axial Spine (Bit Encoding)\n")
+    w("const AXIAL_SPINE = {\n")
+    w(f"	\"version\": {escape_gdscript_string(axial.get('version', '1.4'))},\n")
+    w("	\"axes\": [\n")
     for axis in axial.get('axes', []):
-        gd_lines.append("		{")
-        gd_lines.append(f"			\"bit\": {axis.get('bit', 0)},")
-        gd_lines.append(f"			\"name\": {escape_gdscript_string(axis.get('name', ''))},")
-        gd_lines.append(f"			\"0\": {escape_gdscript_string(axis.get('0', ''))},")
-        gd_lines.append(f"			\"1\": {escape_gdscript_string(axis.get('1', ''))}")
-        gd_lines.append("		},")
-    gd_lines.append("	]")
-    gd_lines.append("}")
-    gd_lines.append("")
+        w("		{\n")
+        w(f"			\"bit\": {axis.get('bit', 0)},\n")
+        w(f"			\"name\": {escape_gdscript_string(axis.get('name', ''))},\n")
+        w(f"			\"0\": {escape_gdscript_string(axis.get('0', ''))},\n")
+        w(f"			\"1\": {escape_gdscript_string(axis.get('1', ''))}\n")
+        w("		},\n")
+    w("	]\n")
+    w("}\n")
+    w("\n")
 
     # Faction count and rings
     rings = set()
@@ -141,135 +257,60 @@ def convert_json_to_gdscript(json_path: Path, output_path: Path):
         rings.add(faction.get('ring', 'unknown'))
         domains.add(faction.get('domain', 'unknown'))
 
-    gd_lines.append("## Statistics")
-    gd_lines.append(f"const TOTAL_FACTIONS = {len(factions)}")
-    gd_lines.append(f"const RINGS = {sorted(list(rings))}")
-    gd_lines.append(f"const DOMAINS = {sorted(list(domains))}")
-    gd_lines.append("")
+    w("## Statistics\n")
+    w(f"const TOTAL_FACTIONS = {len(factions)}\n")
+    w(f"const RINGS = {sorted(list(rings))}\n")
+    w(f"const DOMAINS = {sorted(list(domains))}\n")
+    w("\n")
 
     # All factions array
-    gd_lines.append("## All Factions")
-    gd_lines.append("const ALL_FACTIONS = [")
+    axes = axial.get('axes', [])
+    w("## All Factions\n")
+    w("const ALL_FACTIONS = [\n")
 
     for i, faction in enumerate(factions):
         sig_source = faction.get('signature', faction.get('sig', []))
-        gd_lines.append("	{")
-        gd_lines.append(f"		\"name\": {escape_gdscript_string(faction.get('name', 'Unknown'))},")
-        gd_lines.append(f"		\"domain\": {escape_gdscript_string(faction.get('domain', 'Unknown'))},")
-        gd_lines.append(f"		\"ring\": {escape_gdscript_string(faction.get('ring', 'unknown'))},")
-        gd_lines.append(f"		\"bits\": {format_bits_array(faction.get('bits', []))},")
-        gd_lines.append(f"		\"sig\": {format_emoji_array(sig_source)},")
+        axial_emojis = get_axial_emojis(faction.get('bits', []), axes)
+        w("	{\n")
+        w(f"		\"name\": {escape_gdscript_string(faction.get('name', 'Unknown'))},\n")
+        w(f"		\"domain\": {escape_gdscript_string(faction.get('domain', 'Unknown'))},\n")
+        w(f"		\"ring\": {escape_gdscript_string(faction.get('ring', 'unknown'))},\n")
+        w(f"		\"bits\": {format_bits_array(faction.get('bits', []))},\n")
+        w(f"		\"sig\": {format_emoji_array(sig_source)},\n")
+        w(f"		\"axial_emojis\": {format_emoji_array(axial_emojis)},\n")
+        w(f"		\"all_emojis\": {format_emoji_array(merge_vocabulary(sig_source, axial_emojis))},\n")
 
         # Motto (can be null)
         motto = faction.get('motto')
         if motto is None:
-            gd_lines.append(f"		\"motto\": null,")
+            w(f"		\"motto\": null,\n")
         else:
-            gd_lines.append(f"		\"motto\": {escape_gdscript_string(motto)},")
+            w(f"		\"motto\": {escape_gdscript_string(motto)},\n")
 
-        gd_lines.append(f"		\"description\": {escape_gdscript_string(faction.get('description', ''))}")
+        w(f"		\"description\": {escape_gdscript_string(faction.get('description', ''))}\n")
 
         # Close faction dict (last one has no comma)
         if i < len(factions) - 1:
-            gd_lines.append("	},")
+            w("	},\n")
         else:
-            gd_lines.append("	}")
-
-    gd_lines.append("]")
-    gd_lines.append("")
-
-    # Helper functions
-    gd_lines.append("")
-    gd_lines.append("## Helper Functions")
-    gd_lines.append("")
-    gd_lines.append("static func get_faction_by_name(name: String) -> Dictionary:")
-    gd_lines.append("	\"\"\"Get faction by name\"\"\"")
-    gd_lines.append("	for faction in ALL_FACTIONS:")
-    gd_lines.append("		if faction.name == name:")
-    gd_lines.append("			return faction")
-    gd_lines.append("	return {}")
-    gd_lines.append("")
-    gd_lines.append("static func get_factions_by_ring(ring: String) -> Array:")
-    gd_lines.append("	\"\"\"Get all factions in a specific ring\"\"\"")
-    gd_lines.append("	var result = []")
-    gd_lines.append("	for faction in ALL_FACTIONS:")
-    gd_lines.append("		if faction.ring == ring:")
-    gd_lines.append("			result.append(faction)")
-    gd_lines.append("	return result")
-    gd_lines.append("")
-    gd_lines.append("static func get_factions_by_domain(domain: String) -> Array:")
-    gd_lines.append("	\"\"\"Get all factions in a specific domain\"\"\"")
-    gd_lines.append("	var result = []")
-    gd_lines.append("	for faction in ALL_FACTIONS:")
-    gd_lines.append("		if faction.domain == domain:")
-    gd_lines.append("			result.append(faction)")
-    gd_lines.append("	return result")
-    gd_lines.append("")
-    gd_lines.append("static func get_faction_emoji(faction: Dictionary) -> String:")
-    gd_lines.append("	\"\"\"Get first emoji from faction signature as display emoji\"\"\"")
-    gd_lines.append("	if faction.has(\"sig\") and faction.sig.size() > 0:")
-    gd_lines.append("		return faction.sig[0]")
-    gd_lines.append("	return \"❓\"")
-    gd_lines.append("")
-    gd_lines.append("static func get_faction_signature_string(faction: Dictionary) -> String:")
-    gd_lines.append("	\"\"\"Get faction signature as emoji string\"\"\"")
-    gd_lines.append("	if faction.has(\"sig\"):")
-    gd_lines.append("		return \"\".join(faction.sig)")
-    gd_lines.append("	return \"\"")
-    gd_lines.append("")
-
-    # Vocabulary helpers (used by QuestTheming/GameStateManager)
-    gd_lines.append("static func _get_axial_emojis(bits: Array) -> Array:")
-    gd_lines.append("	\"\"\"Convert 12-bit axial array into emoji list.\"\"\"")
-    gd_lines.append("	var result: Array = []")
-    gd_lines.append("	if bits.is_empty():")
-    gd_lines.append("		return result")
-    gd_lines.append("	for i in range(min(bits.size(), AXIAL_SPINE.axes.size())):")
-    gd_lines.append("		var axis = AXIAL_SPINE.axes[i]")
-    gd_lines.append("		var bit = bits[i]")
-    gd_lines.append("		var emoji = axis.get(\"1\" if bit == 1 else \"0\", \"\")")
-    gd_lines.append("		if emoji != \"\":")
-    gd_lines.append("			result.append(emoji)")
-    gd_lines.append("	return result")
-    gd_lines.append("")
-    gd_lines.append("static func get_faction_vocabulary(faction: Dictionary) -> Dictionary:")
-    gd_lines.append("	\"\"\"Return faction vocabulary bundle (signature, axial, all).\"\"\"")
-    gd_lines.append("	var signature = faction.get(\"sig\", faction.get(\"signature\", []))")
-    gd_lines.append("	var axial = _get_axial_emojis(faction.get(\"bits\", []))")
-    gd_lines.append("	var all = signature.duplicate()")
-    gd_lines.append("	for emoji in axial:")
-    gd_lines.append("		if emoji not in all:")
-    gd_lines.append("			all.append(emoji)")
-    gd_lines.append("	return {\"signature\": signature, \"axial\": axial, \"all\": all}")
-    gd_lines.append("")
-    gd_lines.append("static func get_vocabulary_overlap(vocab_a: Array, vocab_b: Array) -> Array:")
-    gd_lines.append("	\"\"\"Return emojis in vocab_a that are also in vocab_b (preserve order).\"\"\"")
-    gd_lines.append("	var result: Array = []")
-    gd_lines.append("	for emoji in vocab_a:")
-    gd_lines.append("		if emoji in vocab_b and emoji not in result:")
-    gd_lines.append("			result.append(emoji)")
-    gd_lines.append("	return result")
-    gd_lines.append("")
-    gd_lines.append("static func get_faction_banner_path(faction: Dictionary) -> String:")
-    gd_lines.append("	\"\"\"Return banner asset path if available.\"\"\"")
-    gd_lines.append("	var name = faction.get(\"name\", \"\")")
-    gd_lines.append("	if name == \"\":")
-    gd_lines.append("		return \"\"")
-    gd_lines.append("	var path = \"res://Assets/UI/Factions/Banners/%s.svg\" % name")
-    gd_lines.append("	if ResourceLoader.exists(path):")
-    gd_lines.append("		return path")
-    gd_lines.append("	return \"\"")
-    gd_lines.append("")
+            w("	}\n")
+
+    w("]\n")
+    w("\n")
+
+    # Helper functions (static, see GDSCRIPT_HELPERS)
+    w(GDSCRIPT_HELPERS)
 
     # Write to file
-    output_content = "\n".join(gd_lines)
+    output_content = buf.getvalue()
+    line_count = output_content.count("\n") + 1
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(output_content)
 
     print(f"✅ Converted {len(factions)} factions from {json_path} to {output_path}")
     print(f"   Rings: {', '.join(sorted(rings))}")
     print(f"   Domains: {', '.join(sorted(domains))}")
-    print(f"   Output size: {len(output_content)} characters, {len(gd_lines)} lines")
+    print(f"   Output size: {len(output_content)} characters, {line_count} lines")
 
 
 if __name__ == "__main__":
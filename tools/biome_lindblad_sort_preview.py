@@ -18,10 +18,15 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from collections import defaultdict
-from copy import deepcopy
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, DefaultDict, Dict, Iterator, List, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional fast codec; fall back to json
+    orjson = None
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -35,12 +40,17 @@ ORPHAN_BIOME = "_orphan_lindblads"
 
 
 def _load_json(path: Path):
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def _write_json(path: Path, data) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     with path.open("w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
@@ -50,14 +60,22 @@ def _write_text(path: Path, text: str) -> None:
     path.write_text(text, encoding="utf-8")
 
 
-def _merge_outgoing(comp: Dict, target: str, rate: float) -> None:
-    l_out = comp.setdefault("lindblad_outgoing", {})
-    l_out[target] = l_out.get(target, 0.0) + rate
+def _rate_map(comp: Dict, key: str) -> DefaultDict[str, float]:
+    """Return comp[key] as a defaultdict(float), upgrading a loaded dict once."""
+    rates = comp.get(key)
+    if not isinstance(rates, defaultdict):
+        rates = comp[key] = defaultdict(float, rates or {})
+    return rates
 
 
-def _merge_incoming(comp: Dict, source: str, rate: float) -> None:
-    l_in = comp.setdefault("lindblad_incoming", {})
-    l_in[source] = l_in.get(source, 0.0) + rate
+def _plain_rate_maps(biomes: List[Dict]) -> None:
+    """Turn accumulated defaultdict rate maps back into plain dicts."""
+    for biome in biomes:
+        for comp in biome.get("icon_components", {}).values():
+            for key in ("lindblad_outgoing", "lindblad_incoming"):
+                rates = comp.get(key)
+                if isinstance(rates, defaultdict):
+                    comp[key] = dict(rates)
 
 
 def _merge_decay(comp: Dict, decay: Dict) -> Tuple[float, float]:
@@ -72,19 +90,78 @@ def _merge_decay(comp: Dict, decay: Dict) -> Tuple[float, float]:
     return prev_rate, prev_rate
 
 
-def _assign_biomes(
-    emoji: str,
-    emoji_to_biomes: Dict[str, List[str]],
-    multi_mode: str,
-) -> List[str]:
-    biomes = emoji_to_biomes.get(emoji, [])
-    if len(biomes) <= 1:
-        return biomes
+def _assignment_rule(multi_mode: str) -> Callable[[List[str]], List[str]]:
+    """Pick how an emoji's candidate biomes are narrowed, once per run."""
     if multi_mode == "first":
-        return [biomes[0]]
+        return lambda biomes: biomes[:1]
     if multi_mode == "all":
-        return list(biomes)
-    return []
+        return list
+    return lambda biomes: biomes if len(biomes) == 1 else []
+
+
+def _report_lines(
+    args: argparse.Namespace,
+    moved_counts: Dict[str, Dict[str, int]],
+    ambiguous: Dict[str, List[str]],
+    missing: Dict[str, Set[str]],
+    conflicts: List[str],
+    orphan_count: int,
+) -> Iterator[str]:
+    """Yield the markdown migration report line by line."""
+    yield "# Biome Lindblad Migration Report"
+    yield ""
+    yield f"Biomes source: `{args.biomes}`"
+    yield f"Factions source: `{args.factions}`"
+    yield f"Multi-biome mode: `{args.multi}`"
+    yield f"Orphan mode: `{args.orphan}`"
+    yield f"Write mode: `{'enabled' if args.write else 'preview only'}`"
+    yield ""
+
+    yield "## Moved counts by biome"
+    for biome_name, c in sorted(moved_counts.items()):
+        yield f"- {biome_name}: outgoing {c['out']}, incoming {c['in']}, decay {c['decay']}"
+    if not moved_counts:
+        yield "- (none)"
+
+    yield ""
+    yield "## Ambiguous emoji (assigned to multiple biomes)"
+    if ambiguous:
+        for emoji, candidates in sorted(ambiguous.items()):
+            biomes_list = ", ".join(candidates)
+            yield f"- {emoji}: {biomes_list}"
+    else:
+        yield "- (none)"
+
+    yield ""
+    yield "## Orphan emoji (not found in any biome)"
+    if missing:
+        status = "collected" if args.orphan == "collect" else "skipped"
+        for emoji, emoji_kinds in sorted(missing.items()):
+            kinds = ", ".join(sorted(emoji_kinds))
+            yield f"- {emoji}: {kinds} ({status})"
+        yield ""
+        yield f"Total orphan emojis: {len(missing)}"
+        yield f"Orphan handling: {args.orphan}"
+    else:
+        yield "- (none)"
+
+    yield ""
+    yield "## Conflicts"
+    if conflicts:
+        for item in conflicts:
+            yield f"- {item}"
+    else:
+        yield "- (none)"
+
+    yield ""
+    yield "## Summary"
+    total_moved = sum(
+        c["out"] + c["in"] + c["decay"]
+        for c in moved_counts.values()
+    )
+    yield f"- Total Lindblad terms migrated: {total_moved}"
+    yield f"- Biomes with Lindblad data: {len(moved_counts)}"
+    yield f"- Orphan terms collected: {orphan_count}"
 
 
 def main() -> int:
@@ -124,83 +201,96 @@ def main() -> int:
     biomes = _load_json(args.biomes)
     factions = _load_json(args.factions)
 
-    biome_map = {b["name"]: b for b in biomes}
-    for biome in biomes:
-        biome.setdefault("icon_components", {})
-
-    # Create orphan collector if needed
-    orphan_lindblads = {"outgoing": {}, "incoming": {}, "decay": {}}
-
+    # biome name -> that biome's icon_components dict
+    biome_components: Dict[str, Dict] = {}
     emoji_to_biomes: Dict[str, List[str]] = defaultdict(list)
     for biome in biomes:
-        for emoji in biome.get("emojis", []):
-            emoji_to_biomes[emoji].append(biome["name"])
+        name = sys.intern(biome["name"])
+        biome_components[name] = biome.setdefault("icon_components", {})
+        for emoji in biome.get("emojis", ()):
+            emoji_to_biomes[emoji].append(name)
 
-    moved_counts = defaultdict(lambda: {"out": 0, "in": 0, "decay": 0})
-    ambiguous = defaultdict(list)  # emoji -> biomes
-    missing = defaultdict(list)  # emoji -> [kind]
+    # Create orphan collector if needed
+    orphan_lindblads = {
+        "outgoing": defaultdict(lambda: defaultdict(float)),
+        "incoming": defaultdict(lambda: defaultdict(float)),
+        "decay": {},
+    }
+
+    moved_counts = {name: {"out": 0, "in": 0, "decay": 0} for name in biome_components}
+    ambiguous = {}  # emoji -> biomes
+    missing = defaultdict(set)  # emoji -> {kind}
     conflicts = []
 
+    # Resolve each biome emoji once; emojis outside every biome resolve to []
+    assign = _assignment_rule(args.multi)
+    assigned_cache = {
+        emoji: assign(candidates) for emoji, candidates in emoji_to_biomes.items()
+    }
+
     for faction in factions:
         faction_name = faction.get("name", "unknown")
 
         # Lindblad outgoing
         l_out = faction.get("lindblad_outgoing", {}) or {}
         for emoji, targets in l_out.items():
-            assigned = _assign_biomes(emoji, emoji_to_biomes, args.multi)
+            assigned = assigned_cache.get(emoji, [])
             if not assigned:
                 if emoji in emoji_to_biomes:
-                    ambiguous[emoji] = emoji_to_biomes[emoji]
+                    if emoji not in ambiguous:
+                        ambiguous[emoji] = emoji_to_biomes[emoji]
                 else:
-                    missing[emoji].append("outgoing")
+                    missing[emoji].add("outgoing")
                     # Collect orphan if enabled
                     if args.orphan == "collect":
-                        if emoji not in orphan_lindblads["outgoing"]:
-                            orphan_lindblads["outgoing"][emoji] = {}
+                        orphan_out = orphan_lindblads["outgoing"][emoji]
                         for target, rate in targets.items():
-                            orphan_lindblads["outgoing"][emoji][target] = (
-                                orphan_lindblads["outgoing"][emoji].get(target, 0.0) + float(rate)
-                            )
+                            orphan_out[target] += float(rate)
                 continue
             for biome_name in assigned:
-                comp = biome_map[biome_name]["icon_components"].setdefault(emoji, {})
+                comp = biome_components[biome_name].setdefault(emoji, {})
+                if not targets:
+                    continue
+                l_out_d = _rate_map(comp, "lindblad_outgoing")
                 for target, rate in targets.items():
-                    _merge_outgoing(comp, target, float(rate))
-                    moved_counts[biome_name]["out"] += 1
+                    l_out_d[target] += float(rate)
+                moved_counts[biome_name]["out"] += len(targets)
 
         # Lindblad incoming
         l_in = faction.get("lindblad_incoming", {}) or {}
         for emoji, sources in l_in.items():
-            assigned = _assign_biomes(emoji, emoji_to_biomes, args.multi)
+            assigned = assigned_cache.get(emoji, [])
             if not assigned:
                 if emoji in emoji_to_biomes:
-                    ambiguous[emoji] = emoji_to_biomes[emoji]
+                    if emoji not in ambiguous:
+                        ambiguous[emoji] = emoji_to_biomes[emoji]
                 else:
-                    missing[emoji].append("incoming")
+                    missing[emoji].add("incoming")
                     # Collect orphan if enabled
                     if args.orphan == "collect":
-                        if emoji not in orphan_lindblads["incoming"]:
-                            orphan_lindblads["incoming"][emoji] = {}
+                        orphan_in = orphan_lindblads["incoming"][emoji]
                         for source, rate in sources.items():
-                            orphan_lindblads["incoming"][emoji][source] = (
-                                orphan_lindblads["incoming"][emoji].get(source, 0.0) + float(rate)
-                            )
+                            orphan_in[source] += float(rate)
                 continue
             for biome_name in assigned:
-                comp = biome_map[biome_name]["icon_components"].setdefault(emoji, {})
+                comp = biome_components[biome_name].setdefault(emoji, {})
+                if not sources:
+                    continue
+                l_in_d = _rate_map(comp, "lindblad_incoming")
                 for source, rate in sources.items():
-                    _merge_incoming(comp, source, float(rate))
-                    moved_counts[biome_name]["in"] += 1
+                    l_in_d[source] += float(rate)
+                moved_counts[biome_name]["in"] += len(sources)
 
         # Decay
         decay = faction.get("decay", {}) or {}
         for emoji, decay_spec in decay.items():
-            assigned = _assign_biomes(emoji, emoji_to_biomes, args.multi)
+            assigned = assigned_cache.get(emoji, [])
             if not assigned:
                 if emoji in emoji_to_biomes:
-                    ambiguous[emoji] = emoji_to_biomes[emoji]
+                    if emoji not in ambiguous:
+                        ambiguous[emoji] = emoji_to_biomes[emoji]
                 else:
-                    missing[emoji].append("decay")
+                    missing[emoji].add("decay")
                     # Collect orphan if enabled
                     if args.orphan == "collect":
                         rate = float(decay_spec.get("rate", 0.0))
@@ -210,7 +300,7 @@ def main() -> int:
                             orphan_lindblads["decay"][emoji] = {"rate": rate, "target": target}
                 continue
             for biome_name in assigned:
-                comp = biome_map[biome_name]["icon_components"].setdefault(emoji, {})
+                comp = biome_components[biome_name].setdefault(emoji, {})
                 prev_rate, new_rate = _merge_decay(comp, decay_spec)
                 if new_rate > prev_rate:
                     moved_counts[biome_name]["decay"] += 1
@@ -236,98 +326,42 @@ def main() -> int:
         # Populate orphan icon_components
         for emoji, targets in orphan_lindblads["outgoing"].items():
             comp = orphan_biome["icon_components"].setdefault(emoji, {})
-            comp["lindblad_outgoing"] = targets
-            if emoji not in orphan_biome["emojis"]:
-                orphan_biome["emojis"].append(emoji)
+            comp["lindblad_outgoing"] = dict(targets)
         for emoji, sources in orphan_lindblads["incoming"].items():
             comp = orphan_biome["icon_components"].setdefault(emoji, {})
-            comp["lindblad_incoming"] = sources
-            if emoji not in orphan_biome["emojis"]:
-                orphan_biome["emojis"].append(emoji)
+            comp["lindblad_incoming"] = dict(sources)
         for emoji, decay_spec in orphan_lindblads["decay"].items():
             comp = orphan_biome["icon_components"].setdefault(emoji, {})
             comp["decay"] = decay_spec
-            if emoji not in orphan_biome["emojis"]:
-                orphan_biome["emojis"].append(emoji)
+        # icon_components keys are exactly the orphan emojis, in first-seen order
+        orphan_biome["emojis"] = list(orphan_biome["icon_components"])
 
         biomes.append(orphan_biome)
         print(f"Collected {orphan_count} orphan Lindblad terms into {ORPHAN_BIOME}")
 
-    out_biomes = deepcopy(biomes)
+    _plain_rate_maps(biomes)
 
     # Always write preview
     out_file = args.out_dir / "biomes_lindblad_preview.json"
-    _write_json(out_file, out_biomes)
+    _write_json(out_file, biomes)
     print(f"Wrote preview: {out_file}")
 
     # Write to canonical file if --write enabled
     if args.write:
         canonical_path = ROOT / "Core" / "Biomes" / "data" / "biomes_merged.json"
-        _write_json(canonical_path, out_biomes)
+        _write_json(canonical_path, biomes)
         print(f"Wrote canonical: {canonical_path}")
 
-    # Report
-    lines = []
-    lines.append("# Biome Lindblad Migration Report")
-    lines.append("")
-    lines.append(f"Biomes source: `{args.biomes}`")
-    lines.append(f"Factions source: `{args.factions}`")
-    lines.append(f"Multi-biome mode: `{args.multi}`")
-    lines.append(f"Orphan mode: `{args.orphan}`")
-    lines.append(f"Write mode: `{'enabled' if args.write else 'preview only'}`")
-    lines.append("")
-
-    lines.append("## Moved counts by biome")
-    for biome_name in sorted(moved_counts.keys()):
-        c = moved_counts[biome_name]
-        lines.append(
-            f"- {biome_name}: outgoing {c['out']}, incoming {c['in']}, decay {c['decay']}"
-        )
-    if not moved_counts:
-        lines.append("- (none)")
-
-    lines.append("")
-    lines.append("## Ambiguous emoji (assigned to multiple biomes)")
-    if ambiguous:
-        for emoji in sorted(ambiguous.keys()):
-            biomes_list = ", ".join(ambiguous[emoji])
-            lines.append(f"- {emoji}: {biomes_list}")
-    else:
-        lines.append("- (none)")
-
-    lines.append("")
-    lines.append("## Orphan emoji (not found in any biome)")
-    if missing:
-        for emoji in sorted(missing.keys()):
-            kinds = ", ".join(sorted(set(missing[emoji])))
-            status = "collected" if args.orphan == "collect" else "skipped"
-            lines.append(f"- {emoji}: {kinds} ({status})")
-        lines.append("")
-        lines.append(f"Total orphan emojis: {len(missing)}")
-        lines.append(f"Orphan handling: {args.orphan}")
-    else:
-        lines.append("- (none)")
-
-    lines.append("")
-    lines.append("## Conflicts")
-    if conflicts:
-        for item in conflicts:
-            lines.append(f"- {item}")
-    else:
-        lines.append("- (none)")
-
-    lines.append("")
-    lines.append("## Summary")
-    total_moved = sum(
-        c["out"] + c["in"] + c["decay"]
-        for c in moved_counts.values()
-    )
-    lines.append(f"- Total Lindblad terms migrated: {total_moved}")
-    lines.append(f"- Biomes with Lindblad data: {len(moved_counts)}")
-    lines.append(f"- Orphan terms collected: {orphan_count}")
+    # Only biomes that actually received terms are reported
+    moved_counts = {
+        name: c for name, c in moved_counts.items()
+        if c["out"] or c["in"] or c["decay"]
+    }
 
+    # Report
     report_path = args.out_dir / "biome_lindblad_report.md"
-    _write_text(report_path, "\n".join(lines) + "\n")
+    report = _report_lines(args, moved_counts, ambiguous, missing, conflicts, orphan_count)
+    _write_text(report_path, "\n".join(report) + "\n")
     print(f"Wrote report: {report_path}")
 
     return 0
@@ -13,8 +13,14 @@ from __future__ import annotations
 
 import argparse
 import json
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List
+
+try:
+    import orjson
+except ImportError:  # optional fast codec; fall back to json
+    orjson = None
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -33,28 +39,31 @@ def load_json(path: Path) -> List[Dict]:
     if not path.exists():
         print(f"  [SKIP] {path.name} not found")
         return []
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def save_json(path: Path, data: List[Dict]) -> None:
     """Save JSON with pretty formatting."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     with path.open("w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
-def merge_factions(
-    existing: List[Dict],
+def merge_factions_into(
+    by_name: Dict[str, Dict],
     incoming: List[Dict],
     source_name: str
-) -> Tuple[List[Dict], Dict[str, str]]:
-    """Merge incoming factions into existing list.
+) -> Dict[str, str]:
+    """Merge incoming factions into the by-name accumulator in place.
 
     Returns:
-        (merged_list, changes_dict) where changes_dict maps name -> action
+        changes_dict mapping name -> action
     """
-    # Build lookup by name
-    by_name = {f["name"]: f for f in existing}
     changes = {}
 
     for faction in incoming:
@@ -68,9 +77,7 @@ def merge_factions(
             by_name[name] = faction
             changes[name] = f"added from {source_name}"
 
-    # Rebuild list (sorted by name for consistency)
-    merged = sorted(by_name.values(), key=lambda f: f["name"])
-    return merged, changes
+    return changes
 
 
 def main() -> int:
@@ -91,6 +98,9 @@ def main() -> int:
     merged = load_json(MERGED_PATH)
     print(f"  Found {len(merged)} existing factions")
 
+    # Build lookup by name once; every inbox file merges into it
+    by_name = {f["name"]: f for f in merged}
+
     all_changes = {}
 
     # Process each inbox file
@@ -102,12 +112,15 @@ def main() -> int:
             continue
         print(f"  Found {len(incoming)} factions")
 
-        merged, changes = merge_factions(merged, incoming, inbox_file)
+        changes = merge_factions_into(by_name, incoming, inbox_file)
         all_changes.update(changes)
 
         for name, action in sorted(changes.items()):
             print(f"    {name}: {action}")
 
+    # Rebuild list once (sorted by name for consistency)
+    merged = sorted(by_name.values(), key=itemgetter("name"))
+
     # Summary
     print("\n" + "=" * 60)
     print("SUMMARY")
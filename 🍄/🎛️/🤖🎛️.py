@@ -12,6 +12,7 @@ import json
 import shutil
 import subprocess
 import sys
+import tempfile
 import time
 from datetime import datetime
 from pathlib import Path
@@ -33,6 +34,11 @@ def load_plan(path: Path):
     return plan
 
 
+def list_token_logs():
+    with os.scandir(RIG_TOKEN_DIR) as entries:
+        return {entry.name for entry in entries if entry.name.endswith(".tok")}
+
+
 def docmd(step, log_dir: Path, timeout_s: int):
     script = step.get("script")
     if not script:
@@ -42,50 +48,49 @@ def docmd(step, log_dir: Path, timeout_s: int):
         raise FileNotFoundError(f"Script {script_path} does not exist.")
 
     name = step.get("name", script_path.stem)
-    ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    started_at = datetime.utcnow()
+    ts = started_at.strftime("%Y%m%d_%H%M%S")
     output_log = log_dir / f"{name}_{ts}.log"
     summary_log = log_dir / f"{name}_{ts}.json"
 
-    before_tokens = {p.name for p in RIG_TOKEN_DIR.glob("*.tok")}
+    before_tokens = list_token_logs()
 
     cmd = ["bash", str(script_path)]
     start = time.time()
     env = os.environ.copy()
     env["PROJECT_ROOT"] = str(PROJECT_ROOT)
     env["QII_TOKEN_DIR"] = str(RIG_TOKEN_DIR)
-    try:
-        proc = subprocess.run(
-            cmd,
-            cwd=PROJECT_ROOT,
-            capture_output=True,
-            text=True,
-            env=env,
-            timeout=timeout_s,
-        )
-        duration = time.time() - start
-        stdout = proc.stdout
-        stderr = proc.stderr
-        returncode = proc.returncode
-    except subprocess.TimeoutExpired as exc:
-        duration = time.time() - start
-        stdout = exc.stdout or ""
-        stderr = exc.stderr or ""
-        returncode = 124
-
-    with output_log.open("w", encoding="utf-8") as outf:
-        outf.write(stdout)
+    # Stream stdout straight into the log; stderr is spooled to a temp file
+    # and appended after the separator so the log layout stays the same.
+    with output_log.open("w", encoding="utf-8") as outf, \
+            tempfile.TemporaryFile("w+", encoding="utf-8") as errf:
+        try:
+            proc = subprocess.run(
+                cmd,
+                cwd=PROJECT_ROOT,
+                stdout=outf,
+                stderr=errf,
+                env=env,
+                timeout=timeout_s,
+            )
+            duration = time.time() - start
+            returncode = proc.returncode
+        except subprocess.TimeoutExpired:
+            duration = time.time() - start
+            returncode = 124
+
         outf.write("\n--- STDERR ---\n")
-        outf.write(stderr)
+        errf.seek(0)
+        shutil.copyfileobj(errf, outf)
 
-    after_tokens = {p.name for p in RIG_TOKEN_DIR.glob("*.tok")}
-    new_tokens = sorted(list(after_tokens - before_tokens))
+    new_tokens = sorted(list_token_logs() - before_tokens)
 
     summary = {
         "name": name,
         "description": step.get("description", ""),
         "command": " ".join(cmd),
         "returncode": returncode,
-        "start": datetime.utcfromtimestamp(start).isoformat(),
+        "start": started_at.isoformat(),
         "duration_seconds": round(duration, 3),
         "token_logs": new_tokens,
         "output_log": str(output_log.relative_to(PROJECT_ROOT)),